@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    google_api_key: str
+    jwt_secret_key: str
+    redis_host: str
+    redis_port: int
+
+
+settings = Settings()
@@ -4,7 +4,8 @@ import redis.asyncio as redis
 class RedisConn:
     def __init__(self, host: str, port: int, db: int):
         self._pool = redis.ConnectionPool(host=host, port=port, db=db)
+        self._connection = redis.Redis(connection_pool=self._pool)
 
     @property
     def connection(self):
-        return redis.Redis(connection_pool=self._pool)
+        return self._connection
@@ -4,17 +4,32 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
 from tortoise.contrib.fastapi import RegisterTortoise
 
 from router import user, home, mapfind, raid
+from service.gmap import GmapClient
 from utils.string import create_url
 
 load_dotenv(verbose=True)
 logging.getLogger("passlib").setLevel(logging.ERROR)
 
 
+def get_database_uri() -> str:
+    database_uri = os.environ["DATABASE_URI"]
+    # 쿼리 파라미터가 없는 postgres 주소에만 커넥션 풀 크기를 지정
+    if not database_uri.startswith(("postgres", "asyncpg")) or "?" in database_uri:
+        return database_uri
+    return create_url(
+        database_uri + "?",
+        minsize=os.environ.get("DATABASE_POOL_MINSIZE", 5),
+        maxsize=os.environ.get("DATABASE_POOL_MAXSIZE", 20),
+        max_inactive_connection_lifetime=300,
+    )
+
+
 @asynccontextmanager
 async def lifespan(server: FastAPI):
     print(
@@ -30,7 +45,7 @@ async def lifespan(server: FastAPI):
     )
     async with RegisterTortoise(
         server,
-        db_url=os.environ["DATABASE_URI"],
+        db_url=get_database_uri(),
         modules={
             "models": [
                 "database.user",
@@ -41,7 +56,11 @@ async def lifespan(server: FastAPI):
         generate_schemas=True,
         add_exception_handlers=True,
     ):
-        yield
+        server.state.gmap_client = GmapClient()
+        try:
+            yield
+        finally:
+            await server.state.gmap_client.close()
 
 
 app = FastAPI(
@@ -49,6 +68,7 @@ app = FastAPI(
     title="Sunrinthon",
     description="솦과인내 어쩌구 팀",
     version="0.1",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(user.router)
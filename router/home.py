@@ -1,27 +1,22 @@
-from dotenv import load_dotenv
-
 from fastapi import APIRouter, Depends
 from fastapi_restful.cbv import cbv
-from passlib.context import CryptContext
 from interface.response import JSONResponse
 from interface.session import Session as SessionInterface
 
 from database.user import User as DatabaseUser
 from service.credential import depends_credential, Credential, get_current_user
 from service.session import Session, get_active_session
-from service.gmap import GmapClient
+from service.gmap import GmapClient, depends_gmap_client
 
 from utils.string import get_country_locality_string
 
-load_dotenv(verbose=True)
 router = APIRouter(tags=["home"], prefix="/home")
 
 
 @cbv(router)
 class Home:
-    password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     credential: Credential = Depends(depends_credential)
-    gmap_client = GmapClient()
+    gmap_client: GmapClient = Depends(depends_gmap_client)
 
     @router.get("/search", description="장소 검색")
     async def search_place(self, query_string: str):
@@ -1,10 +1,12 @@
-import os
-
-from dotenv import load_dotenv
+import asyncio
+import operator
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi_restful.cbv import cbv
-from passlib.context import CryptContext
+from pydantic import TypeAdapter
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from app.config import settings
 from interface.response import JSONResponse
 from interface.place import (
     PlaceDetail,
@@ -14,12 +16,13 @@ from interface.place import (
     PlaceSurvey,
 )
 from database.place import Place as PlaceDatabase
+from utils.coalesce import coalesced
 from utils.string import create_url
 
 from service.credential import depends_credential, Credential
-from service.gmap import GmapClient
+from service.gmap import GmapClient, depends_gmap_client
+from service.places_cache import PlacesCache, depends_places_cache
 
-load_dotenv(verbose=True)
 router = APIRouter(tags=["mapfind"], prefix="/mapfind")
 
 match_place_types = {
@@ -29,17 +32,42 @@ match_place_types = {
     "doctor": "hospital",
 }
 
+get_location = operator.itemgetter("latitude", "longitude")
+place_list_adapter = TypeAdapter(list[Place])
+
+photo_media_query = create_url(
+    "",
+    maxHeightPx=144,
+    maxWidthPx=330,
+    key=settings.google_api_key,
+)
+
+
+def get_place_type(place_each: dict) -> str:
+    return match_place_types[place_each.get("primaryType") or place_each["types"][0]]
+
+
+def create_place(place_each: dict) -> Place:
+    # Google 응답으로만 만들기 때문에 검증을 생략
+    latitude, longitude = get_location(place_each["location"])
+    return Place.model_construct(
+        place_id=place_each["id"],
+        display_name=place_each["displayName"]["text"],
+        type=get_place_type(place_each),
+        location=PlaceLocation.model_construct(latitude=latitude, longitude=longitude),
+        open_now=(place_each.get("currentOpeningHours") or {}).get("openNow", False),
+    )
+
 
 @cbv(router)
 class MapFind:
-    password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     credential: Credential = Depends(depends_credential)
-    gmap_client = GmapClient()
+    gmap_client: GmapClient = Depends(depends_gmap_client)
+    places_cache: PlacesCache = Depends(depends_places_cache)
 
-    @router.get("/scan", description="특정 위치 주변의 피난처,병원을 제공합니다.")
-    async def scan(
-        self, latitude: str, longitude: str, radius: int, max_results: int = 5
-    ):
+    async def fetch_places_nearby(
+        self, latitude: str, longitude: str, radius: int, max_results: int
+    ) -> dict:
         places_data = await self.gmap_client.get_place_nearby(
             place_types=["hospital", "subway_station", "school", "doctor"],
             latitude=latitude,
@@ -48,40 +76,84 @@ class MapFind:
             max_results=max_results,
             field_mask=[
                 "places.location",
-                "places.displayName",
+                "places.displayName.text",
                 "places.id",
                 "places.primaryType",
                 "places.types",
-                "places.currentOpeningHours",
+                "places.currentOpeningHours.openNow",
             ],
         )
+        scan_key = PlacesCache.scan_key(latitude, longitude, radius, max_results)
+        await self.places_cache.set(
+            {scan_key: places_data}, expire=PlacesCache.scan_expire
+        )
+        return places_data
 
-        places = [
-            Place(
-                place_id=place_each["id"],
-                display_name=place_each["displayName"]["text"],
-                type=(
-                    match_place_types[place_each.get("primaryType")]
-                    if place_each.get("primaryType")
-                    else match_place_types[place_each["types"][0]]
-                ),
-                location=PlaceLocation(
-                    latitude=place_each["location"]["latitude"],
-                    longitude=place_each["location"]["longitude"],
-                ),
-                open_now=(
-                    place_each.get("currentOpeningHours").get("openNow")
-                    if place_each.get("currentOpeningHours")
-                    else False
+    async def get_places_nearby(
+        self, latitude: str, longitude: str, radius: int, max_results: int
+    ) -> dict:
+        scan_key = PlacesCache.scan_key(latitude, longitude, radius, max_results)
+        (places_data,) = await self.places_cache.get(scan_key)
+        if places_data is None:
+            places_data = await coalesced(
+                scan_key,
+                lambda: self.fetch_places_nearby(
+                    latitude, longitude, radius, max_results
                 ),
             )
-            for place_each in places_data["places"]
-        ]
+        return places_data
+
+    async def fetch_place_data(self, place_id: str) -> tuple[dict, dict]:
+        place_data, place_photo = await asyncio.gather(
+            self.gmap_client.get_place_detail(
+                place_id,
+                field_mask=[
+                    "id",
+                    "displayName.text",
+                    "primaryType",
+                    "types",
+                    "internationalPhoneNumber",
+                    "location.latitude",
+                    "location.longitude",
+                    "googleMapsUri",
+                    "currentSecondaryOpeningHours.openNow",
+                ],
+            ),
+            self.gmap_client.get_place_photos(place_id),
+        )
+        await self.places_cache.set(
+            {
+                PlacesCache.detail_key(place_id): place_data,
+                PlacesCache.photos_key(place_id): place_photo,
+            },
+            expire=PlacesCache.detail_expire,
+        )
+        return place_data, place_photo
+
+    async def get_place_data(self, place_id: str) -> tuple[dict, dict]:
+        detail_key = PlacesCache.detail_key(place_id)
+        photos_key = PlacesCache.photos_key(place_id)
+        place_data, place_photo = await self.places_cache.get(detail_key, photos_key)
+        if place_data is None or place_photo is None:
+            place_data, place_photo = await coalesced(
+                detail_key, lambda: self.fetch_place_data(place_id)
+            )
+        return place_data, place_photo
+
+    @router.get("/scan", description="특정 위치 주변의 피난처,병원을 제공합니다.")
+    async def scan(
+        self, latitude: str, longitude: str, radius: int, max_results: int = 5
+    ):
+        places_data = await self.get_places_nearby(
+            latitude, longitude, radius, max_results
+        )
+
+        places = [create_place(place_each) for place_each in places_data["places"]]
 
         return JSONResponse(
             code=200,
             message="Location updated successfully",
-            data={"places": places},
+            data={"places": place_list_adapter.dump_python(places)},
         )
 
     @router.get(
@@ -89,46 +161,49 @@ class MapFind:
         description="특정 플레이스의 정보를 제공합니다.",
     )
     async def get_place_detail(self, place_id: str):
-        place_data = await self.gmap_client.get_place_detail(place_id)
-        place_photo = await self.gmap_client.get_place_photos(place_id)
-
-        place_database, _ = await PlaceDatabase.get_or_create(
-            defaults={
-                "place_id": place_data["id"],
-                "display_name": place_data["displayName"]["text"],
-            },
-            place_id=place_id,
+        (place_data, place_photo), place_database = await asyncio.gather(
+            self.get_place_data(place_id),
+            PlaceDatabase.filter(place_id=place_id)
+            .first()
+            .values("sleep_available", "safe_rating"),
         )
+        if place_database is None:
+            try:
+                place_model = await PlaceDatabase.create(
+                    place_id=place_id,
+                    display_name=place_data["displayName"]["text"],
+                )
+                place_database = {
+                    "sleep_available": place_model.sleep_available,
+                    "safe_rating": place_model.safe_rating,
+                }
+            except IntegrityError:
+                # 동시에 들어온 요청이 먼저 생성한 경우
+                place_database = await PlaceDatabase.get(place_id=place_id).values(
+                    "sleep_available", "safe_rating"
+                )
         return JSONResponse(
             code=200,
             message="Place detail found successfully",
             data=PlaceDetail(
                 place_id=place_data["id"],
                 display_name=place_data["displayName"]["text"],
-                type=(
-                    match_place_types[place_data.get("primaryType")]
-                    if place_data.get("primaryType")
-                    else match_place_types[place_data["types"][0]]
-                ),
+                type=get_place_type(place_data),
                 phone_number=place_data["internationalPhoneNumber"],
                 location=PlaceLocation(
                     latitude=place_data["location"]["latitude"],
                     longitude=place_data["location"]["longitude"],
                 ),
                 google_map_uri=place_data["googleMapsUri"],
-                open_now=(
-                    place_data.get("currentSecondaryOpeningHours")[0].get("openNow")
-                    if place_data.get("currentSecondaryOpeningHours")
-                    else False
-                ),
-                sleep_available=PlaceSleepType(place_database.sleep_available).value,
-                safe_rating=place_database.safe_rating,
-                photos=[create_url(
-                    str("https://places.googleapis.com/v1/" + photo["name"] + "/media?"),
-                    maxHeightPx=144,
-                    maxWidthPx=330,
-                    key=os.environ["GOOGLE_API_KEY"]
-                ) for photo in place_photo["photos"]],
+                open_now=next(
+                    iter(place_data.get("currentSecondaryOpeningHours") or ()), {}
+                ).get("openNow", False),
+                sleep_available=PlaceSleepType(place_database["sleep_available"]).value,
+                safe_rating=place_database["safe_rating"],
+                photos=[
+                    f"https://places.googleapis.com/v1/{photo['name']}/media?{photo_media_query}"
+                    for photo in place_photo["photos"]
+                ],
             ).model_dump(),
         )
 
@@ -137,22 +212,25 @@ class MapFind:
         description="특정 플레이스의 정보를 업데이트합니다.",
     )
     async def survey_place(self, place_id: str, survey_data: PlaceSurvey):
-        if not await PlaceDatabase.exists(place_id=place_id):
-            raise HTTPException(
-                status_code=404,
-                detail="Place not found",
-            )
-        place_model = await PlaceDatabase.get(place_id=place_id)
+        place_query = PlaceDatabase.filter(place_id=place_id)
         if survey_data.survey_type == "safe_rating":
-            place_model.safe_rating += survey_data.survey_value
+            updated_count = await place_query.update(
+                safe_rating=F("safe_rating") + survey_data.survey_value
+            )
         elif survey_data.survey_type == "sleep_available":
-            place_model.sleep_available = survey_data.survey_value
+            updated_count = await place_query.update(
+                sleep_available=survey_data.survey_value
+            )
         else:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid survey type",
             )
-        await place_model.save()
+        if not updated_count:
+            raise HTTPException(
+                status_code=404,
+                detail="Place not found",
+            )
         return JSONResponse(
             code=200,
             message="Survey updated successfully",
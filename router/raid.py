@@ -1,27 +1,23 @@
-from dotenv import load_dotenv
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi_restful.cbv import cbv
-from passlib.context import CryptContext
 from interface.response import JSONResponse
 from interface.raid import RaidAlarm, RaidReport
 from utils.string import get_name_from, transform_raid_data
 
 from service.credential import depends_credential, Credential
-from service.gmap import GmapClient
+from service.gmap import GmapClient, depends_gmap_client
 from service.uasiren import UASiren
 from database.raid import RaidReport as RaidReportDatabase
 
-load_dotenv(verbose=True)
 router = APIRouter(tags=["raid"], prefix="/raid")
 
 
 @cbv(router)
 class Raid:
-    password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     credential: Credential = Depends(depends_credential)
-    gmap_client = GmapClient()
+    gmap_client: GmapClient = Depends(depends_gmap_client)
     uasiren = UASiren()
 
     @router.get("/scan", description="특정 위치 주변의 경보 가져오기")
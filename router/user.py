@@ -1,10 +1,8 @@
 import uuid
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi_restful.cbv import cbv
-from passlib.context import CryptContext
 from interface.response import JSONResponse
 import traceback
 
@@ -14,13 +12,11 @@ from service.google_oauth import GoogleOAuth
 from service.credential import depends_credential, Credential, get_current_user
 from service.session import Session, get_active_session
 
-load_dotenv(verbose=True)
 router = APIRouter(tags=["user"], prefix="/user")
 
 
 @cbv(router)
 class User:
-    password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     credential: Credential = Depends(depends_credential)
 
     @router.post(
@@ -59,8 +55,7 @@ class User:
             )
             token_expired_time = datetime.now() + access_token_expires
             session = Session(token=access_token)
-            await session.set_expire(access_token_expires)
-            await session.update({})
+            await session.create({}, expire=access_token_expires)
 
             return JSONResponse(
                 code=200,
@@ -84,7 +79,7 @@ class User:
     ):
         _current_user = await current_user
         token = request.headers["Authorization"].split(" ")[1]
-        await self.credential.delete_token(token=token)
+        await self.credential.delete_token(token=token, user_id=str(_current_user.id))
         return JSONResponse(code=200, message="Logout successful", data=None)
 
     @router.get("/@me", description="프로필 조회")
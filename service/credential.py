@@ -1,4 +1,5 @@
-import os
+import time
+import asyncio
 import jwt
 
 from passlib.context import CryptContext
@@ -9,35 +10,62 @@ from fastapi import HTTPException, status, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 
+from app.config import settings
 from app.redisconn import RedisConn
 from database.user import User as DatabaseUser
 
+# bcrypt 해시는 검증만 하고 새 해시는 argon2id로 생성
+password_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__rounds=2,
+    argon2__parallelism=1,
+)
+
 security = HTTPBearer(
     scheme_name="User Access Token",
     description="/auth에서 발급받은 토큰을 입력해주세요",
 )
 
 
+redis_pool = RedisConn(host=settings.redis_host, port=settings.redis_port, db=0)
+
+
 def get_redis_pool():
-    redis_pool = RedisConn(
-        host=os.environ["REDIS_HOST"], port=int(os.environ["REDIS_PORT"]), db=0
-    )
     return redis_pool.connection
 
 
+jwt_cache_size = 10000
+jwt_cache: dict[str, tuple[float, dict]] = {}
+
+
+def decode_access_token(token: str) -> dict:
+    # 같은 토큰이 반복해서 들어오므로 만료 전까지 검증 결과를 재사용
+    cached = jwt_cache.pop(token, None)
+    if cached is not None and cached[0] > time.time():
+        jwt_cache[token] = cached
+        return cached[1]
+    payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+    if len(jwt_cache) >= jwt_cache_size:
+        jwt_cache.pop(next(iter(jwt_cache)))
+    jwt_cache[token] = (payload.get("exp", 0), payload)
+    return payload
+
+
 class Credential:
     def __init__(self):
         self.redis_connection = get_redis_pool()
 
     @staticmethod
-    def verify_password(
-        password_context: CryptContext, plain_password: str, hashed_password: str
-    ):
-        return password_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str):
+        return await asyncio.to_thread(
+            password_context.verify, plain_password, hashed_password
+        )
 
     @staticmethod
-    def get_password_hash(cls, password):
-        return cls.password_context.hash(password)
+    async def get_password_hash(password: str):
+        return await asyncio.to_thread(password_context.hash, password)
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: timedelta):
@@ -45,23 +73,41 @@ class Credential:
         expire = datetime.now(timezone.utc) + expires_delta
         to_encode.update({"exp": expire})
         encoded_token = jwt.encode(
-            to_encode, os.environ["JWT_SECRET_KEY"], algorithm="HS256"
+            to_encode, settings.jwt_secret_key, algorithm="HS256"
         )
         return encoded_token
 
     async def register_token(self, expire: timedelta, user_id: str, token: str):
-        await self.redis_connection.hset("user", token, user_id)
-        await self.redis_connection.expire(token, expire)
+        async with self.redis_connection.pipeline(transaction=False) as pipe:
+            pipe.set("session:" + token, user_id, ex=expire)
+            pipe.sadd("user_sessions:" + user_id, token)
+            pipe.expire("user_sessions:" + user_id, expire)
+            await pipe.execute()
+
+    async def delete_token(self, token: str, user_id: str):
+        jwt_cache.pop(token, None)
+        async with self.redis_connection.pipeline(transaction=False) as pipe:
+            pipe.delete("session:" + token)
+            pipe.srem("user_sessions:" + user_id, token)
+            await pipe.execute()
+
+    async def invalidate_user_sessions(self, user_id: str):
+        tokens = await self.redis_connection.smembers("user_sessions:" + user_id)
+        await self.redis_connection.delete(
+            "user_sessions:" + user_id,
+            *["session:" + token.decode() for token in tokens],
+        )
+
+    async def is_valid_token(self, token: str, user_id: str):
+        stored_user_id = await self.redis_connection.get("session:" + token)
+        return stored_user_id is not None and stored_user_id.decode() == user_id
 
-    async def delete_token(self, token: str):
-        await self.redis_connection.hdel("user", token)
 
-    async def is_valid_token(self, token: str):
-        return await self.redis_connection.hexists("user", token)
+credential_instance = Credential()
 
 
 async def depends_credential():
-    return Credential()
+    return credential_instance
 
 
 async def get_current_user(
@@ -75,15 +121,13 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            session_token, os.environ["JWT_SECRET_KEY"], algorithms=["HS256"]
-        )
+        payload = decode_access_token(session_token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except InvalidTokenError:
         raise credentials_exception
-    if not await credential.is_valid_token(token=session_token):
+    if not await credential.is_valid_token(token=session_token, user_id=user_id):
         raise credentials_exception
     user = await DatabaseUser.get(id=user_id)
     if user is None:
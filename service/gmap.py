@@ -1,11 +1,9 @@
-import os
-from dotenv import load_dotenv
+from fastapi import Request
 
+from app.config import settings
 from utils.request import BaseRequest
 from utils.string import create_url
 
-load_dotenv(verbose=True)
-
 
 class GmapClient(BaseRequest):
     async def search_place(self, text_query: str, field_mask: list[str]) -> dict:
@@ -14,7 +12,7 @@ class GmapClient(BaseRequest):
             url,
             json={"textQuery": text_query},
             headers={
-                "X-Goog-Api-Key": os.environ["GOOGLE_API_KEY"],
+                "X-Goog-Api-Key": settings.google_api_key,
                 "X-Goog-FieldMask": ",".join(field_mask),
             },
         )
@@ -24,7 +22,7 @@ class GmapClient(BaseRequest):
         url = create_url(
             "https://maps.googleapis.com/maps/api/geocode/json?",
             address=address,
-            key=os.environ["GOOGLE_API_KEY"],
+            key=settings.google_api_key,
         )
         response = await self.get(url)
         return await response.json()
@@ -33,7 +31,7 @@ class GmapClient(BaseRequest):
         url = create_url(
             "https://maps.googleapis.com/maps/api/geocode/json?",
             latlng=f"{latitude},{longitude}",
-            key=os.environ["GOOGLE_API_KEY"],
+            key=settings.google_api_key,
         )
         response = await self.get(url)
         return await response.json()
@@ -70,7 +68,7 @@ class GmapClient(BaseRequest):
         response = await self.post(
             url,
             headers={
-                "X-Goog-Api-Key": os.environ["GOOGLE_API_KEY"],
+                "X-Goog-Api-Key": settings.google_api_key,
                 "X-Goog-FieldMask": ",".join(field_mask),
             },
             json=extra_data,
@@ -80,13 +78,14 @@ class GmapClient(BaseRequest):
     async def get_place_detail(
         self,
         place_id: str,
+        field_mask: list[str] | None = None,
     ) -> dict:
         url = "https://places.googleapis.com/v1/places/" + place_id
         response = await self.get(
             url,
             headers={
-                "X-Goog-Api-Key": os.environ["GOOGLE_API_KEY"],
-                "X-Goog-FieldMask": "*",
+                "X-Goog-Api-Key": settings.google_api_key,
+                "X-Goog-FieldMask": ",".join(field_mask) if field_mask else "*",
             },
         )
         return await response.json()
@@ -99,8 +98,12 @@ class GmapClient(BaseRequest):
         response = await self.get(
             url,
             headers={
-                "X-Goog-Api-Key": os.environ["GOOGLE_API_KEY"],
-                "X-Goog-FieldMask": ",".join(["id", "displayName", "photos"]),
+                "X-Goog-Api-Key": settings.google_api_key,
+                "X-Goog-FieldMask": "photos.name",
             },
         )
         return await response.json()
+
+
+async def depends_gmap_client(request: Request) -> GmapClient:
+    return request.app.state.gmap_client
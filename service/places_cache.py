@@ -0,0 +1,60 @@
+import logging
+
+import orjson
+from redis.exceptions import RedisError
+
+from service.credential import get_redis_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlacesCache:
+    detail_expire = 3600
+    scan_expire = 300
+
+    def __init__(self):
+        self.redis_connection = get_redis_pool()
+
+    @staticmethod
+    def detail_key(place_id: str) -> str:
+        return "gmap:detail:" + place_id
+
+    @staticmethod
+    def photos_key(place_id: str) -> str:
+        return "gmap:photos:" + place_id
+
+    @staticmethod
+    def scan_key(latitude: str, longitude: str, radius: int, max_results: int) -> str:
+        # 소수점 3자리(약 50~100m) 격자로 묶어서 근처 요청끼리 캐시를 공유
+        latitude_bucket = round(float(latitude), 3)
+        longitude_bucket = round(float(longitude), 3)
+        return f"gmap:scan:{latitude_bucket}:{longitude_bucket}:{radius}:{max_results}"
+
+    async def get(self, *keys: str) -> list[dict | None]:
+        # 캐시는 보조 수단이므로 Redis 장애 시 Google API로 바로 요청
+        try:
+            values = await self.redis_connection.mget(keys)
+        except RedisError:
+            logger.warning("Places cache read failed", exc_info=True)
+            return [None] * len(keys)
+        return [orjson.loads(value) if value is not None else None for value in values]
+
+    async def set(self, items: dict[str, dict], expire: int) -> None:
+        # Google 에러 응답은 캐싱하지 않음
+        if any("error" in payload for payload in items.values()):
+            return
+        try:
+            async with self.redis_connection.pipeline(transaction=False) as pipe:
+                for key, payload in items.items():
+                    pipe.setex(key, expire, orjson.dumps(payload))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Places cache write failed", exc_info=True)
+
+
+places_cache_instance = PlacesCache()
+
+
+async def depends_places_cache():
+    return places_cache_instance
@@ -17,26 +17,32 @@ class Session:
         self.token = token
         self.redis_connection = get_redis_pool()
 
+    async def create(self, data: dict, expire: timedelta) -> None:
+        session_key = "TokenSession" + self.token
+        await self.redis_connection.set(session_key, json.dumps(data), ex=expire)
+
     async def set_expire(self, expire: timedelta) -> None:
         session_key = "TokenSession" + self.token
         await self.redis_connection.expire(session_key, expire)
 
     async def update(self, data: dict) -> None:
         session_key = "TokenSession" + self.token
-        await self.redis_connection.hset("session", session_key, json.dumps(data))
+        await self.redis_connection.set(
+            session_key, json.dumps(data), keepttl=True, xx=True
+        )
 
     async def get(self) -> dict:
         session_key = "TokenSession" + self.token
-        data = await self.redis_connection.hget("session", session_key)
+        data = await self.redis_connection.get(session_key)
         return json.loads(data)
 
     async def delete(self) -> None:
         session_key = "TokenSession" + self.token
-        await self.redis_connection.hdel("session", session_key)
+        await self.redis_connection.delete(session_key)
 
     async def is_valid(self) -> bool:
         session_key = "TokenSession" + self.token
-        return await self.redis_connection.hexists("session", session_key)
+        return await self.redis_connection.exists(session_key) > 0
 
 
 async def get_active_session(
@@ -0,0 +1,15 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+inflight: dict[str, asyncio.Task] = {}
+
+
+async def coalesced(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    # 같은 key로 진행 중인 요청이 있으면 새로 보내지 않고 그 결과를 같이 기다림
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # 기다리던 요청 하나가 취소돼도 공유 작업은 취소되지 않도록 shield
+    return await asyncio.shield(task)
@@ -1,10 +1,28 @@
 from typing import Any
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 
 class BaseRequest:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        limit: int = 100,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
         self.session: ClientSession | None = None
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+    def get_session(self) -> ClientSession:
+        if not self.session or self.session.closed:
+            self.session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit, keepalive_timeout=self.keepalive_timeout
+                ),
+                timeout=ClientTimeout(total=self.timeout),
+            )
+        return self.session
 
     async def request(
         self,
@@ -12,21 +30,16 @@ class BaseRequest:
         method: str,
         **kwargs: Any,
     ):
-        if not self.session or self.session.closed:
-            self.session = ClientSession()
-
-        resp = await self.session.request(method, url, **kwargs)
+        resp = await self.get_session().request(method, url, **kwargs)
 
         return resp
 
     async def post(self, url: str, **kwargs: Any):
-        if not self.session or self.session.closed:
-            self.session = ClientSession()
-
         return await self.request(url, "POST", **kwargs)
 
     async def get(self, url: str, **kwargs: Any):
-        if not self.session or self.session.closed:
-            self.session = ClientSession()
-
         return await self.request(url, "GET", **kwargs)
+
+    async def close(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()